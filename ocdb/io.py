@@ -393,6 +393,12 @@ import bibrecord.database
 import numpy as np
 import oyaml as yaml
 
+# Use the (much faster) C implementation of PyYAML, if available
+try:
+    from oyaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from oyaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 try:
     # noinspection PyUnresolvedReferences
     import jinja2
@@ -665,19 +671,22 @@ class TxtDataImporter(DataImporter):
     """
 
     def _import_data(self):
-        data = np.loadtxt(self.data_filename)
-        self.material.n_data.axes[0].values = data[:, 0]
+        # Transpose to one contiguous row per column, so that each quantity
+        # is stored contiguously in memory and can be processed without
+        # strided access or further copies.
+        data = np.ascontiguousarray(np.loadtxt(self.data_filename, ndmin=2).T)
+        self.material.n_data.axes[0].values = data[0]
         self.material.n_data.axes[0].quantity = "wavelength"
         self.material.n_data.axes[0].symbol = r"\lambda"
         self.material.n_data.axes[0].unit = "nm"
-        self.material.n_data.data = data[:, 1]
+        self.material.n_data.data = data[1]
         self.material.k_data.axes[0] = self.material.n_data.axes[0]
-        self.material.k_data.data = data[:, 2]
-        if data.shape[1] > 3:  # uncertainties are present
-            self.material.n_data.lower_bounds = data[:, 3]
-            self.material.n_data.upper_bounds = data[:, 4]
-            self.material.k_data.lower_bounds = data[:, 5]
-            self.material.k_data.upper_bounds = data[:, 6]
+        self.material.k_data.data = data[2]
+        if data.shape[0] > 3:  # uncertainties are present
+            self.material.n_data.lower_bounds = data[3]
+            self.material.n_data.upper_bounds = data[4]
+            self.material.k_data.lower_bounds = data[5]
+            self.material.k_data.upper_bounds = data[6]
 
 
 def create_metadata_file(filename=""):
@@ -705,7 +714,7 @@ def create_metadata_file(filename=""):
     metadata.versions.append(VersionMetadata())
     metadata.references.append("")
     with open(filename, "w+", encoding="utf8") as file:
-        file.write(yaml.dump(metadata.to_dict()))
+        file.write(yaml.dump(metadata.to_dict(), Dumper=_Dumper))
 
 
 class Metadata:
@@ -915,7 +924,7 @@ class Metadata:
 
         """
         with open(filename, "r+", encoding="utf8") as file:
-            metadata = yaml.safe_load(file.read())
+            metadata = yaml.load(file.read(), Loader=_Loader)  # nosec
         self.from_dict(metadata=metadata)
 
 
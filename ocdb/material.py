@@ -419,7 +419,14 @@ class Material:
             processing_step.data = k_data
             k_data = processing_step.process()
         wavelengths = n_data.axes[0].values
-        n_k = n_data.data - 1j * k_data.data
+        # Fill real and imaginary part in place, avoiding the temporary
+        # complex arrays created by "n - 1j * k"
+        n_k = np.empty(
+            n_data.data.shape,
+            dtype=np.result_type(n_data.data, k_data.data, np.complex64),
+        )
+        n_k.real = n_data.data
+        np.negative(k_data.data, out=n_k.imag)
         if uncertainties:
             output = (
                 wavelengths,
@@ -174,6 +174,10 @@ class Interpolation(ProcessingStep):
         values : :class:`float` or :class:`numpy.ndarray`
             Values to perform the interpolation for
 
+            Scalars, lists, and arrays are accepted. Upon processing, the
+            values are stored as one-dimensional float64 array, flattening
+            multidimensional input.
+
         kind : :class:`str`
             Kind of interpolation used.
 
@@ -182,6 +186,9 @@ class Interpolation(ProcessingStep):
 
     Raises
     ------
+    ValueError
+        Raised if no values are provided or values are NaN.
+
     ValueError
         Raised if the values are not within the data range.
 
@@ -236,56 +243,109 @@ class Interpolation(ProcessingStep):
         self._interpolate_data()
 
     def _sanitise_parameters(self):
-        if isinstance(self.parameters["values"], (float, int)):
-            # noinspection PyTypedDict
-            self.parameters["values"] = np.asarray(
-                [self.parameters["values"]]
-            )
+        # Values are always stored as a contiguous 1D float64 array, whether
+        # provided as scalar, list, or (multidimensional) array.
+        if self.parameters["values"] is None:
+            raise ValueError("No values provided for interpolation")
+        # noinspection PyTypedDict
+        self.parameters["values"] = np.ravel(
+            np.ascontiguousarray(self.parameters["values"], dtype=np.float64)
+        )
+        if np.isnan(self.parameters["values"]).any():
+            raise ValueError("Values for interpolation must not be NaN")
 
     def _check_range(self):
-        axes_values = self.data.axes[0].values
+        # Axis values are monotonic, hence the extrema are at either end,
+        # ascending for wavelengths, but descending after conversion to eV.
+        axis_values = self.data.axes[0].values
+        axis_min, axis_max = sorted((axis_values[0], axis_values[-1]))
         if (
-            min(self.parameters["values"]) < min(axes_values)
-            or max(self.parameters["values"]) > max(axes_values)
+            self.parameters["values"].min() < axis_min
+            or self.parameters["values"].max() > axis_max
             # This line is here to satisfy Black...
         ):
             message = (
                 f"Requested range not within data range. "
-                f"Available range: [{min(axes_values)}, {max(axes_values)}]"
+                f"Available range: [{axis_min}, {axis_max}]"
             )
             raise ValueError(message)
 
     def _interpolate_data(self):
+        data_arrays = {"data": self.data.data}
         if self.data.has_uncertainties():
-            data_arrays = ["data", "lower_bounds", "upper_bounds"]
-        else:
-            data_arrays = ["data"]
-        for data_array in data_arrays:
-            # noinspection PyTypeChecker
-            if self.parameters["kind"]:
-                interpolated = np.interp(
-                    self.parameters["values"],
-                    self.data.axes[0].values,
-                    getattr(self.data, data_array),
-                )
-                setattr(self.data, data_array, interpolated)
-            else:
-                index = [
-                    np.where(self.data.axes[0].values == value)[0]
-                    for value in self.parameters["values"]
-                    if any(np.where(self.data.axes[0].values == value)[0])
-                ]
-                if not index:
-                    raise ValueError("Value(s) not available")
-                if len(index) != len(self.parameters["values"]):
-                    raise ValueError("Value(s) not available")
+            data_arrays["lower_bounds"] = self.data.lower_bounds
+            data_arrays["upper_bounds"] = self.data.upper_bounds
+        if self.parameters["kind"]:
+            lower, upper, weight = self._interpolation_weights()
+            for name, values in data_arrays.items():
                 setattr(
                     self.data,
-                    data_array,
-                    getattr(self.data, data_array)[index],
+                    name,
+                    self._interpolate(values, lower, upper, weight),
                 )
+        else:
+            index = self._axis_indices()
+            for name, values in data_arrays.items():
+                setattr(self.data, name, values[index])
         self.data.axes[0].values = self.parameters["values"]
 
+    @staticmethod
+    def _interpolate(values, lower, upper, weight):
+        if not weight.any():  # All values present in axis, just index
+            return values[lower]
+        # Keep precision of floating data, e.g. float32, but interpolate
+        # integer data as floats
+        dtype = np.result_type(values.dtype, np.float32)
+        values = values.astype(dtype, copy=False)
+        return values[lower] + weight.astype(dtype, copy=False) * (
+            values[upper] - values[lower]
+        )
+
+    def _axis_indices(self):
+        # Look up all values at once. Axis values are monotonic, ascending
+        # for wavelengths, but descending after conversion to eV.
+        axis_values = self.data.axes[0].values
+        values = self.parameters["values"]
+        descending = axis_values[0] > axis_values[-1]
+        if descending:
+            axis_values = axis_values[::-1]
+        index = np.minimum(
+            np.searchsorted(axis_values, values), axis_values.size - 1
+        )
+        if not np.array_equal(axis_values[index], values):
+            raise ValueError("Value(s) not available")
+        if descending:
+            index = axis_values.size - 1 - index
+        return index
+
+    def _interpolation_weights(self):
+        # Indices of the neighbouring points and relative distances,
+        # computed once and shared by data and uncertainty bounds alike.
+        axis_values = self.data.axes[0].values
+        values = self.parameters["values"]
+        descending = axis_values[0] > axis_values[-1]
+        if descending:
+            axis_values = axis_values[::-1]
+        lower = np.searchsorted(axis_values, values, side="right") - 1
+        lower = np.clip(lower, 0, max(axis_values.size - 2, 0))
+        upper = np.minimum(lower + 1, axis_values.size - 1)
+        distance = axis_values[upper] - axis_values[lower]
+        weight = np.divide(
+            values - axis_values[lower],
+            distance,
+            out=np.zeros(values.shape),
+            where=distance != 0,
+        )
+        # Values equal to the upper neighbour (only possible for the last
+        # axis value due to clipping) are exact hits as well
+        at_upper = weight == 1
+        lower[at_upper] = upper[at_upper]
+        weight[at_upper] = 0
+        if descending:
+            lower = axis_values.size - 1 - lower
+            upper = axis_values.size - 1 - upper
+        return lower, upper, weight
+
 
 class UnitConversion(ProcessingStep):
     """
@@ -214,8 +214,9 @@ requires three steps:
 * Create an environment inheriting from :class:`GenericEnvironment` that at
   least sets the path to the templates in the package data.
 
-* Create a reporter class inheriting from :class:`Reporter` and set its
-  :attr:`Reporter._environment` attribute to the environment just created.
+* Create a reporter class inheriting from :class:`Reporter` and override
+  its :meth:`Reporter._create_environment` method to return the environment
+  just created.
 
 
 Module documentation
@@ -223,6 +224,7 @@ Module documentation
 
 """
 
+import concurrent.futures
 import contextlib
 import datetime
 import importlib.metadata
@@ -238,6 +240,9 @@ except ImportError:
     pass
 
 
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
 class Reporter:
     """
     Base class for reports.
@@ -271,6 +276,21 @@ class Reporter:
     report : :class:`str`
         Actual report, i.e. rendered template.
 
+    timestamp : :class:`str`
+        Date and time the report was created, available in the context.
+
+        If not provided, the current date and time are used upon each
+        rendering. Set it explicitly to have several reports share the same
+        timestamp.
+
+    environment_options : :class:`dict`
+        Options used for creating the Jinja environment of the reporter.
+
+        Class attribute, as reporters of the same class share their
+        environment. Hence, set it *before* creating the first reporter,
+        *e.g.* to reuse compiled templates across sessions by setting a
+        ``bytecode_cache``. For details, see :class:`GenericEnvironment`.
+
     Raises
     ------
     ValueError
@@ -294,17 +314,73 @@ class Reporter:
     you provide a name for a template that cannot be found, a respective
     exception will be raised.
 
+    .. note::
+
+        Reporters share their Jinja environment and hence the compiled
+        templates. Changed templates are detected by their modification time.
+        Therefore, a template rewritten within the resolution of the file
+        system timestamps (up to a few seconds, depending on the file
+        system) will be rendered in its previous version.
+
     """
 
+    environment_options = {}
+    _environments = {}
+
     def __init__(self):
         self.template = ""
         self.filename = ""
         self.context = {}
         self.report = ""
+        self.timestamp = ""
 
-        self._environment = GenericEnvironment()
+        self._environment = self._get_environment()
         self._jinja_template = None
 
+    @classmethod
+    def _get_environment(cls):
+        """
+        Return the Jinja environment shared between reporter instances.
+
+        Creating a Jinja environment is rather expensive, and reusing the
+        environment allows to reuse the templates already compiled. As the
+        file system loader of the environment operates relative to the
+        current directory, there is one environment per reporter class and
+        working directory.
+
+        Note that Jinja detects changed templates by their modification
+        time. Hence, a template rewritten within the resolution of the file
+        system timestamps will still be served from the cache, *i.e.* in its
+        previous version.
+
+        Returns
+        -------
+        environment : :class:`GenericEnvironment`
+            Jinja environment as created by :meth:`_create_environment`
+
+        """
+        key = (cls, os.getcwd())
+        if key not in cls._environments:
+            cls._environments[key] = cls._create_environment()
+        return cls._environments[key]
+
+    @classmethod
+    def _create_environment(cls):
+        """
+        Create the Jinja environment used for rendering templates.
+
+        Reporters for other output formats override this method to return
+        the environment for their format, passing on the options set in
+        :attr:`environment_options`.
+
+        Returns
+        -------
+        environment : :class:`GenericEnvironment`
+            Jinja environment for rendering generic templates
+
+        """
+        return GenericEnvironment(env=cls.environment_options)
+
     def render(self):
         """
         Render the template.
@@ -341,10 +417,11 @@ class Reporter:
         self.context["template_dir"] = os.path.split(self.template)[0]
         if self.context["template_dir"]:
             self.context["template_dir"] += os.path.sep
-        # noinspection PyTypeChecker
-        self.context["timestamp"] = datetime.datetime.now().strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
+        timestamp = self.timestamp
+        if not timestamp:
+            # noinspection PyTypeChecker
+            timestamp = datetime.datetime.now().strftime(_TIMESTAMP_FORMAT)
+        self.context["timestamp"] = timestamp
 
     def _render(self):
         self.report = self._jinja_template.render(self.context)
@@ -355,6 +432,10 @@ class Reporter:
 
         The filename is set in the :attr:`filename` attribute.
 
+        If the file exists already with exactly the same contents, it is
+        left untouched. Thus, its modification time is retained, allowing
+        tools such as make or latexmk to detect that nothing has changed.
+
         Raises
         ------
         ValueError
@@ -363,8 +444,17 @@ class Reporter:
         """
         if not self.filename:
             raise ValueError("No output filename provided")
-        with open(self.filename, mode="w+", encoding="utf8") as output_file:
-            output_file.write(self.report)
+        contents = self.report.encode("utf8")
+        if self._file_up_to_date(contents):
+            return
+        with open(self.filename, mode="wb") as output_file:
+            output_file.write(contents)
+
+    def _file_up_to_date(self, contents):
+        if not os.path.exists(self.filename):
+            return False
+        with open(self.filename, mode="rb") as file:
+            return file.read() == contents
 
     def create(self):
         """
@@ -379,6 +469,62 @@ class Reporter:
         self.save()
 
 
+class FileSystemLoader(jinja2.FileSystemLoader):
+    """
+    Jinja loader for templates in the file system, given by absolute path.
+
+    Templates with relative names are looked up in the directories of the
+    search path only, as with :class:`jinja2.FileSystemLoader`. Templates
+    with absolute names are directly loaded from their location instead of
+    looking them up in each directory of the search path. Hence, only
+    absolute names hit the file system root, not every failed lookup of a
+    relative name.
+
+    """
+
+    def __init__(self, searchpath, encoding="utf-8", followlinks=False):
+        super().__init__(
+            searchpath=searchpath, encoding=encoding, followlinks=followlinks
+        )
+        self._root_loader = jinja2.FileSystemLoader(
+            os.path.abspath("/"), encoding=encoding, followlinks=followlinks
+        )
+
+    def get_source(self, environment, template):
+        """
+        Get the source of a template.
+
+        Templates with absolute names are loaded directly from the file
+        system root, all other templates are looked up in the directories
+        of the search path.
+
+        Parameters
+        ----------
+        environment : :class:`jinja2.Environment`
+            Environment the template is loaded for
+
+        template : :class:`str`
+            Name of the template, either relative or absolute
+
+        Returns
+        -------
+        source : :class:`tuple`
+            Source of the template, its filename, and a function checking
+            whether the template is up to date
+
+            See :meth:`jinja2.BaseLoader.get_source` for details.
+
+        Raises
+        ------
+        jinja2.exceptions.TemplateNotFound
+            Raised if the template could not be found.
+
+        """
+        if os.path.isabs(template):
+            return self._root_loader.get_source(environment, template)
+        return super().get_source(environment, template)
+
+
 class GenericEnvironment(jinja2.Environment):
     """
     Jinja environment for rendering generic templates.
@@ -391,11 +537,14 @@ class GenericEnvironment(jinja2.Environment):
 
     Currently, there are two loaders implemented, in exactly this sequence:
 
-    #. :class:`jinja2.FileSystemLoader`
+    #. :class:`FileSystemLoader`
 
         Looking for templates in the current directory and using an absolute
         path.
 
+        The directories searched can be set using the ``search_path``
+        parameter (see below for details).
+
     #. :class:`jinja2.PackageLoader`
 
         Looking for templates in the ocdb package in the package path
@@ -413,28 +562,64 @@ class GenericEnvironment(jinja2.Environment):
         resulting :class:`jinja.Environment`. Hence, to set the path, use the
         ``path`` parameter (see below for details).
 
+        The dictionary itself is not modified.
+
     path : :class:`str`
         Path to the templates within the package.
 
         This is the relative path, *i.e.* the last, format-specific part, for
         the templates.
 
+    search_path : :class:`list`
+        Directories searched for templates in the file system.
+
+        Defaults to the current directory. Absolute paths to templates
+        are always supported, regardless of the search path.
+
+
+    .. note::
+
+        Compiled templates are kept in memory by Jinja, and as reporters
+        share their environment, templates need to be parsed only once per
+        Python session. To reuse compiled templates across sessions, a
+        ``bytecode_cache`` can be set using the ``env`` parameter, or, for
+        reporters, using :attr:`Reporter.environment_options`. It is not set
+        by default, as such a cache stores the compiled templates outside
+        the current directory.
+
+        Templates are still checked for changes on each lookup, as Jinja's
+        ``auto_reload`` is left enabled. When rendering many reports from
+        templates that do not change, set ``auto_reload`` to :obj:`False`
+        using the ``env`` parameter, or, for reporters, using
+        :attr:`Reporter.environment_options`, to save these checks.
+
     """
 
-    def __init__(self, env=None, path=""):
-        if not env:
-            env = {}
-        package_path = os.path.join("templates/report", path)
+    _package_loaders = {}
+
+    def __init__(self, env=None, path="", search_path=None):
+        env = dict(env) if env else {}
+        if not search_path:
+            search_path = [os.path.abspath(".")]
         env["loader"] = jinja2.ChoiceLoader(
             [
-                jinja2.FileSystemLoader(
-                    [os.path.abspath("."), os.path.abspath("/")]
-                ),
-                jinja2.PackageLoader(__package__, package_path=package_path),
+                FileSystemLoader(search_path),
+                self._get_package_loader(path),
             ]
         )
         super().__init__(**env)
 
+    @classmethod
+    def _get_package_loader(cls, path=""):
+        # Locating the package resources is comparably expensive, and the
+        # package contents do not change at runtime. Hence, share loaders.
+        if path not in cls._package_loaders:
+            package_path = os.path.join("templates/report", path)
+            cls._package_loaders[path] = jinja2.PackageLoader(
+                __package__, package_path=package_path
+            )
+        return cls._package_loaders[path]
+
 
 class LaTeXEnvironment(GenericEnvironment):
     """
@@ -477,7 +662,7 @@ class LaTeXEnvironment(GenericEnvironment):
 
     Currently, there are two loaders implemented, in exactly this sequence:
 
-    #. :class:`jinja2.FileSystemLoader`
+    #. :class:`FileSystemLoader`
 
         Looking for templates in the current directory and using an absolute
         path
@@ -488,10 +673,18 @@ class LaTeXEnvironment(GenericEnvironment):
         "templates/report/latex/", *i.e.* the directory for all LaTeX report
         templates of the ocdb package.
 
+    Parameters
+    ----------
+    env : :class:`dict`
+        Dictionary with further settings for the
+        :class:`jinja2.Environment`, *e.g.* a ``bytecode_cache``.
+
+        Settings provided here take precedence over the ones listed above.
+
     """
 
-    def __init__(self):
-        env = {
+    def __init__(self, env=None):
+        latex_env = {
             "block_start_string": "%{",
             "block_end_string": "}%",
             "variable_start_string": "{@",
@@ -503,7 +696,9 @@ class LaTeXEnvironment(GenericEnvironment):
             "trim_blocks": True,
             "autoescape": False,
         }
-        super().__init__(env=env, path="latex")
+        if env:
+            latex_env.update(env)
+        super().__init__(env=latex_env, path="latex")
 
 
 class LaTeXReporter(Reporter):
@@ -516,14 +711,17 @@ class LaTeXReporter(Reporter):
 
     Note that for compiling a temporary directory is used, such as not to
     clutter the current working directory with all the auxiliary files
-    usually created during a (pdf)LaTeX run. Furthermore, currently, only a
-    single (pdf)LaTeX run is performed with option
-    ``-interaction=nonstopmode`` passed in order to not block further
-    execution.
+    usually created during a (pdf)LaTeX run. This directory is only created
+    upon calling :meth:`compile`. Furthermore, (pdf)LaTeX is run with
+    option ``-interaction=nonstopmode`` passed in order to not block further
+    execution. Further (pdf)LaTeX runs are only performed as long as the log
+    file states this to be necessary, *e.g.* to get cross-references right,
+    but at most :attr:`max_reruns` times.
 
     .. important::
         For enhanced security, the temporary directory used for compiling
-        the template will be removed after successful compilation.
+        the template will be removed after compilation, even if compiling
+        failed.
         Therefore, no traces of your report should remain outside the
         current directory controlled by the user.
 
@@ -532,8 +730,8 @@ class LaTeXReporter(Reporter):
     includes : :class:`list`
         List of files that need to be present for compiling the template.
 
-        These files will be copied into the temporary directory used for
-        compiling the template.
+        These files will be copied (or hard-linked, where possible) into the
+        temporary directory used for compiling the template.
 
     latex_executable : :class:`str`
         Name of/path to the LaTeX executable.
@@ -548,6 +746,37 @@ class LaTeXReporter(Reporter):
         Only in case this attribute is set to a non-empty value will the
         bibliography be built.
 
+    always_rerun : :class:`bool`
+        Whether to always run (pdf)LaTeX a final time.
+
+        Defaults to False
+
+        Usually, (pdf)LaTeX is only run a final time if the log file of the
+        previous run indicates this to be necessary, *e.g.* to get
+        cross-references right.
+
+    max_reruns : :class:`int`
+        Maximum number of additional (pdf)LaTeX runs.
+
+        Defaults to 3
+
+        Prevents endless compiling of documents that never stabilise.
+
+    latexmk_executable : :class:`str`
+        Name of/path to the latexmk executable.
+
+        Defaults to ""
+
+        Only in case this attribute is set to a non-empty value will latexmk
+        be used for compiling, in a single invocation taking care of all
+        (pdf)LaTeX and BibTeX/Biber runs necessary. Note that in this case,
+        latexmk decides which programs to call, based on its configuration.
+
+    verbose : :class:`bool`
+        Whether to print the output of the (pdf)LaTeX and BibTeX runs.
+
+        Defaults to False
+
     Raises
     ------
     FileNotFoundError
@@ -556,6 +785,9 @@ class LaTeXReporter(Reporter):
     FileNotFoundError
         Raised if the BibTeX executable could not be found
 
+    FileNotFoundError
+        Raised if the latexmk executable could not be found
+
 
     Examples
     --------
@@ -575,15 +807,21 @@ class LaTeXReporter(Reporter):
 
     """
 
+    _executables = {}
+
     def __init__(self):
         super().__init__()
         self.includes = []
         self.latex_executable = "pdflatex"
         self.bibtex_executable = ""
+        self.always_rerun = False
+        self.max_reruns = 3
+        self.latexmk_executable = ""
+        self.verbose = False
 
-        self._environment = LaTeXEnvironment()
-        self._temp_dir = tempfile.mkdtemp()
-        self._pwd = os.getcwd()
+    @classmethod
+    def _create_environment(cls):
+        return LaTeXEnvironment(env=cls.environment_options)
 
     def compile(self):
         """
@@ -605,48 +843,98 @@ class LaTeXReporter(Reporter):
         FileNotFoundError
             Raised if the BibTeX executable could not be found
 
+        FileNotFoundError
+            Raised if the latexmk executable could not be found
+
         """
         self._check_for_prerequisites()
-        self._copy_files_to_temp_dir()
-        self._compile_latex()
+        temp_dir = tempfile.mkdtemp()
+        try:
+            self._copy_files_to_temp_dir(temp_dir)
+            if self.latexmk_executable:
+                self._compile_latexmk(temp_dir)
+            else:
+                self._compile_stepwise(temp_dir)
+            self._copy_files_from_temp_dir(temp_dir)
+        finally:
+            self._remove_temp_dir(temp_dir)
+
+    def _compile_stepwise(self, temp_dir):
+        """Compile the report calling (pdf)LaTeX and BibTeX separately.
+
+        (pdf)LaTeX is rerun as long as necessary, but at most
+        :attr:`max_reruns` times.
+        """
+        self._compile_latex(temp_dir)
         if self.bibtex_executable:
-            self._compile_bibtex()
-            self._compile_latex()
-        # Note: In order to resolve references in LaTeX, compile twice.
-        #       There might be a better option, automatically detecting
-        #       whether compiling twice is necessary, but for now...
-        self._compile_latex()
-        self._copy_files_from_temp_dir()
-        self._remove_temp_dir()
+            self._compile_bibtex(temp_dir)
+            self._compile_latex(temp_dir)
+        if self.always_rerun:
+            self._compile_latex(temp_dir)
+        for _ in range(self.max_reruns):
+            if not self._rerun_necessary(temp_dir):
+                break
+            self._compile_latex(temp_dir)
 
     def _check_for_prerequisites(self):
-        if not shutil.which(self.latex_executable):
+        if not self._which(self.latex_executable):
             raise FileNotFoundError(
                 f"LaTeX executable {self.latex_executable} not found"
             )
-        if self.bibtex_executable and not shutil.which(
-            self.bibtex_executable
-        ):
+        if self.bibtex_executable and not self._which(self.bibtex_executable):
             raise FileNotFoundError(
                 f"BibTeX executable {self.bibtex_executable} not found"
             )
+        if self.latexmk_executable and not self._which(
+            self.latexmk_executable
+        ):
+            raise FileNotFoundError(
+                f"latexmk executable {self.latexmk_executable} not found"
+            )
+
+    @property
+    def _path(self):
+        return os.path.split(self.filename)[0]
+
+    @property
+    def _filename_wo_path(self):
+        return os.path.split(self.filename)[1]
 
-    def _copy_files_to_temp_dir(self):
+    @property
+    def _basename(self):
+        return os.path.splitext(self._filename_wo_path)[0]
+
+    @classmethod
+    def _which(cls, executable):
+        """Locate an executable, remembering executables found before.
+
+        Looking up executables walks all directories in the PATH. Only
+        successful lookups are remembered, and only for the PATH they were
+        found in, hence installing an executable or changing the PATH takes
+        effect immediately.
+        """
+        key = (executable, os.environ.get("PATH", ""))
+        if key not in cls._executables:
+            path = shutil.which(executable)
+            if not path:
+                return None
+            cls._executables[key] = path
+        return cls._executables[key]
+
+    def _copy_files_to_temp_dir(self, temp_dir):
         """Copy all necessary files to compile the LaTeX report to temp_dir
 
         Takes care of relative or absolute paths of both, report and includes.
         """
-        _, filename_wo_path = os.path.split(self.filename)
-        shutil.copy2(
-            self.filename, os.path.join(self._temp_dir, filename_wo_path)
+        self._stage(
+            self.filename,
+            os.path.join(temp_dir, self._filename_wo_path),
         )
         for filename in self.includes:
             _, filename_wo_path = os.path.split(filename)
-            shutil.copy2(
-                filename, os.path.join(self._temp_dir, filename_wo_path)
-            )
+            self._stage(filename, os.path.join(temp_dir, filename_wo_path))
 
-    def _compile_latex(self):
+    def _compile_latex(self, temp_dir):
         """Actual compiling of the report.
 
         The compiling takes place in a temporary directory that gets
@@ -656,65 +944,115 @@ class LaTeXReporter(Reporter):
         (pdf)LaTeX is currently called with the "-interaction=nonstopmode"
         option in order to not block further execution.
         """
-        with change_working_dir(self._temp_dir):
-            _, filename_wo_path = os.path.split(self.filename)
+        with change_working_dir(temp_dir):
             # Path stripped, there should be no security implications.
-            process = subprocess.run(
+            self._run(
                 [
-                    self.latex_executable,  # nosec
+                    self.latex_executable,
                     "-output-directory",
-                    self._temp_dir,
+                    temp_dir,
                     "-interaction=nonstopmode",
-                    filename_wo_path,
-                ],
-                check=False,
-                capture_output=True,
+                    self._filename_wo_path,
+                ]
             )
-            print(process.stdout.decode())
-            print(process.stderr.decode())
 
-    def _compile_bibtex(self):
+    def _compile_bibtex(self, temp_dir):
         """Creating bibliography of the report.
 
         The compiling takes place in a temporary directory that gets
         removed after the (successful) compile step using the
         :meth:`_remove_temp_dir` method.
         """
-        with change_working_dir(self._temp_dir):
-            _, filename_wo_path = os.path.split(self.filename)
+        with change_working_dir(temp_dir):
             # Path stripped, there should be no security implications.
-            process = subprocess.run(
+            self._run(
                 [
-                    self.bibtex_executable,  # nosec
-                    os.path.splitext(filename_wo_path)[0],
-                ],
-                check=False,
-                capture_output=True,
+                    self.bibtex_executable,
+                    self._basename,
+                ]
+            )
+
+    def _compile_latexmk(self, temp_dir):
+        """Compile the report, including its bibliography, using latexmk.
+
+        latexmk takes care of running (pdf)LaTeX and BibTeX/Biber as often
+        as necessary, in a single invocation.
+        """
+        with change_working_dir(temp_dir):
+            # Path stripped, there should be no security implications.
+            self._run(
+                [
+                    self.latexmk_executable,
+                    "-pdf",
+                    "-interaction=nonstopmode",
+                    f"-output-directory={temp_dir}",
+                    self._filename_wo_path,
+                ]
+            )
+
+    def _run(self, command):
+        """Run an external program, such as (pdf)LaTeX or BibTeX.
+
+        The output of the program is only captured and printed if
+        :attr:`verbose` is set. Otherwise, it is discarded right away.
+        """
+        if self.verbose:
+            process = subprocess.run(  # nosec
+                command, check=False, capture_output=True
             )
             print(process.stdout.decode())
             print(process.stderr.decode())
+        else:
+            subprocess.run(  # nosec
+                command,
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+
+    def _rerun_necessary(self, temp_dir):
+        """Check whether (pdf)LaTeX needs to be run again.
+
+        Similar to what latexmk does, the log file of the last (pdf)LaTeX run
+        is searched for the hints LaTeX and packages such as biblatex write
+        in case another run is necessary, *e.g.* to resolve references.
+        """
+        log_filename = os.path.join(
+            temp_dir, ".".join([self._basename, "log"])
+        )
+        if not os.path.exists(log_filename):  # No hints to act upon
+            return False
+        with open(log_filename, "rb") as file:
+            log = file.read()
+        return any(hint in log for hint in (b"Rerun to get", b"rerun LaTeX"))
 
-    def _copy_files_from_temp_dir(self):
+    def _copy_files_from_temp_dir(self, temp_dir):
         """Copy result of compile step from temporary to target directory
 
         Takes care of any relative or absolute paths provided for the
         report output file provided in :attr:`filename`.
         """
-        basename, _ = os.path.splitext(self.filename)
-        path, basename = os.path.split(basename)
-        pdf_filename = ".".join([basename, "pdf"])
-        if os.path.isabs(path):
-            shutil.copy2(
-                os.path.join(self._temp_dir, pdf_filename),
-                os.path.join(path, pdf_filename),
-            )
-        else:
-            shutil.copy2(
-                os.path.join(self._temp_dir, pdf_filename),
-                os.path.join(self._pwd, path, pdf_filename),
-            )
+        pdf_filename = ".".join([self._basename, "pdf"])
+        self._stage(
+            os.path.join(temp_dir, pdf_filename),
+            os.path.join(self._path, pdf_filename),
+        )
 
-    def _remove_temp_dir(self):
+    @staticmethod
+    def _stage(source, destination):
+        """Provide a file at a destination, avoiding copying where possible.
+
+        If source and destination reside on the same file system, a hard
+        link is created, as this does not require copying the contents.
+        Otherwise, or if the destination exists already, the file is copied.
+        """
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
+
+    @staticmethod
+    def _remove_temp_dir(temp_dir):
         """Remove temporary directory used for compile step.
 
         The (pdf)LaTeX step is performed in a temporary directory such as
@@ -726,8 +1064,10 @@ class LaTeXReporter(Reporter):
         e.g., in the log file, is lost. However, manually compiling the
         report is probably the easiest way of figuring out if something
         gets wrong with the (pdf)LaTeX compile step
+
+        The temporary directory is removed even if compiling failed.
         """
-        shutil.rmtree(self._temp_dir)
+        shutil.rmtree(temp_dir)
 
 
 @contextlib.contextmanager
@@ -828,6 +1168,17 @@ class MaterialReporter:
     containing the references as BibTeX bibliography, and ``Co-report.tex``
     and ``Co-report.pdf`` as LaTeX source and compiled PDF of the report.
 
+    To create reports for several materials, use :meth:`create_many`, as it
+    creates the reports in parallel, making use of all your CPU cores. Where
+    new processes are started using the "spawn" method (the default on
+    Windows and macOS), the call needs to be protected by an ``if __name__
+    == "__main__":`` guard in your script:
+
+    .. code-block::
+
+        if __name__ == "__main__":
+            MaterialReporter.create_many(ocdb.elements)
+
     .. important::
 
         As the :meth:`create` method does do the (pdf)LaTeX compiling for
@@ -845,6 +1196,8 @@ class MaterialReporter:
 
     """
 
+    _version = ""
+
     def __init__(self):
         self.material = None
         self.reporter = None
@@ -855,6 +1208,7 @@ class MaterialReporter:
             "latex": LaTeXReporter,
         }
         self._includes = []
+        self._timestamp = ""
 
     def create(self):
         """
@@ -890,10 +1244,54 @@ class MaterialReporter:
         """
         self._check_prerequisits()
         self.reporter = self._output_formats[self.output_format]()
+        self._timestamp = datetime.datetime.now().strftime(_TIMESTAMP_FORMAT)
         self._create_figure()
         self._create_bibliography()
         self._create_report()
 
+    @classmethod
+    def create_many(cls, materials=None, max_workers=None):
+        """
+        Create reports for several materials in parallel.
+
+        Each report is created in a separate process, using a fresh reporter
+        for each material, as with calling :meth:`create`. As creating a
+        report is dominated by compiling the LaTeX sources, this speeds up
+        creating reports for many materials roughly by the number of CPU
+        cores available.
+
+        Parameters
+        ----------
+        materials : :class:`list`
+            Materials the reports should be generated for.
+
+            Any iterable of :obj:`ocdb.material.Material` objects works,
+            including collections such as :obj:`ocdb.elements`.
+
+        max_workers : :class:`int`
+            Maximum number of processes used.
+
+            Defaults to the number of CPU cores.
+
+        """
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            list(executor.map(cls._create_for_material, materials or []))
+
+    @classmethod
+    def _create_for_material(cls, material):
+        reporter = cls()
+        reporter.material = material
+        reporter.create()
+
+    @classmethod
+    def _get_version(cls):
+        # Looking up package metadata involves scanning the file system.
+        if not cls._version:
+            cls._version = importlib.metadata.version(__package__)
+        return cls._version
+
     def _check_prerequisits(self):
         if not self.material:
             raise ValueError("No material to report on")
@@ -909,6 +1307,7 @@ class MaterialReporter:
     def _create_bibliography(self):
         reporter = LaTeXReporter()
         reporter.template = "literature.bib"
+        reporter.timestamp = self._timestamp
         reporter.filename = f"{self.material.symbol}.bib"
         references = [
             reference.to_bib() for reference in self.material.references
@@ -921,6 +1320,7 @@ class MaterialReporter:
         reporter = LaTeXReporter()
         reporter.bibtex_executable = "biber"
         reporter.template = "material.tex"
+        reporter.timestamp = self._timestamp
         reporter.filename = f"{self.material.symbol}-report.tex"
         reporter.includes = self._includes
         references = ",".join(
@@ -933,17 +1333,16 @@ class MaterialReporter:
             }
             for version in self.material.versions
         ]
+        metadata = self.material.metadata
         reporter.context["material"] = {
             "symbol": self.material.symbol,
             "name": self.material.name,
-            "date": self.material.metadata.date,
-            "uncertainties": self.material.metadata.uncertainties.confidence_interval,
-            "comment": self.material.metadata.comment,
+            "date": metadata.date,
+            "uncertainties": metadata.uncertainties.confidence_interval,
+            "comment": metadata.comment,
             "references": references,
             "versions": versions,
         }
-        reporter.context["ocdb"] = {
-            "version": importlib.metadata.version(__package__)
-        }
+        reporter.context["ocdb"] = {"version": self._get_version()}
         reporter.create()
         reporter.compile()
@@ -3,7 +3,9 @@ import setuptools
 
 
 def read(filename):
-    with open(os.path.join(os.path.dirname(__file__), filename)) as file:
+    with open(
+        os.path.join(os.path.dirname(__file__), filename), encoding="utf8"
+    ) as file:
         content = file.read()
     return content
 
@@ -49,7 +51,7 @@ setuptools.setup(
     extras_require={
         "presentation": [
             "matplotlib",
-            "jinja2",
+            "jinja2>=3.0",
         ],
         "dev": [
             "prospector",
@@ -1,6 +1,7 @@
 import copy
 import datetime
 import os
+import tempfile
 import unittest
 
 import bibrecord.record
@@ -56,18 +57,22 @@ class TestDataImporterFactory(unittest.TestCase):
 
 
 class TestDataImporter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # References are only read, hence load them once for all tests.
+        cls.references = io.References()
+        cls.references.load()
+
     def setUp(self):
         self.importer = io.DataImporter()
-        self.data_filename = "foo.txt"
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_filename = os.path.join(self.temp_dir.name, "foo.txt")
         self.metadata = io.Metadata()
         self.metadata.file["name"] = self.data_filename
         self.metadata.material = {"name": "Cobalt", "symbol": "Co"}
-        self.references = io.References()
-        self.references.load()
 
     def tearDown(self):
-        if os.path.exists(self.data_filename):
-            os.remove(self.data_filename)
+        self.temp_dir.cleanup()
 
     def create_data_file(self):
         with open(self.data_filename, "w+", encoding="utf8") as f:
@@ -198,50 +203,55 @@ DATA_WITHOUT_UNCERTAINTIES = """
 
 
 class TestTxtDataImporter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Data files are only read, hence write them once for all tests.
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.data_filename = os.path.join(cls.temp_dir.name, "foo.txt")
+        with open(cls.data_filename, "w+", encoding="utf8") as f:
+            f.write(DATA_WITH_UNCERTAINTIES)
+        cls.data_filename_without_uncertainties = os.path.join(
+            cls.temp_dir.name, "bar.txt"
+        )
+        with open(
+            cls.data_filename_without_uncertainties, "w+", encoding="utf8"
+        ) as f:
+            f.write(DATA_WITHOUT_UNCERTAINTIES)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
     def setUp(self):
         self.importer = io.TxtDataImporter()
-        self.data_filename = "foo.txt"
         self.metadata = io.Metadata()
         self.metadata.file["name"] = self.data_filename
         self.metadata.material = {"name": "Cobalt", "symbol": "Co"}
 
-    def tearDown(self):
-        if os.path.exists(self.data_filename):
-            os.remove(self.data_filename)
-
-    def create_data_file(self):
-        with open(self.data_filename, "w+", encoding="utf8") as f:
-            f.write(DATA_WITH_UNCERTAINTIES)
-
     def test_instantiate_class(self):
         pass
 
     def test_import_data_sets_wavelength_in_n(self):
-        self.create_data_file()
         self.importer.metadata = self.metadata
         material_ = self.importer.import_data()
         self.assertTrue(material_.n()[0][0])
 
     def test_import_data_sets_data_in_n(self):
-        self.create_data_file()
         self.importer.metadata = self.metadata
         material_ = self.importer.import_data()
         self.assertTrue(material_.n()[1][0])
 
     def test_import_data_sets_wavelength_in_k(self):
-        self.create_data_file()
         self.importer.metadata = self.metadata
         material_ = self.importer.import_data()
         self.assertTrue(material_.k()[0][0])
 
     def test_import_data_sets_data_in_k(self):
-        self.create_data_file()
         self.importer.metadata = self.metadata
         material_ = self.importer.import_data()
         self.assertTrue(material_.k()[1][0])
 
     def test_import_data_sets_wavelength_metadata_in_n(self):
-        self.create_data_file()
         self.importer.metadata = self.metadata
         material_ = self.importer.import_data()
         self.assertEqual("wavelength", material_.n_data.axes[0].quantity)
@@ -249,7 +259,6 @@ class TestTxtDataImporter(unittest.TestCase):
         self.assertEqual("nm", material_.n_data.axes[0].unit)
 
     def test_import_data_sets_wavelength_metadata_in_k(self):
-        self.create_data_file()
         self.importer.metadata = self.metadata
         material_ = self.importer.import_data()
         self.assertEqual("wavelength", material_.k_data.axes[0].quantity)
@@ -257,16 +266,22 @@ class TestTxtDataImporter(unittest.TestCase):
         self.assertEqual("nm", material_.k_data.axes[0].unit)
 
     def test_import_data_with_uncertainties_sets_uncertainties(self):
-        self.create_data_file()
         self.importer.metadata = self.metadata
         material_ = self.importer.import_data()
         self.assertTrue(material_.n_data.has_uncertainties())
         self.assertTrue(material_.k_data.has_uncertainties())
 
+    def test_import_data_with_single_line_sets_data(self):
+        filename = os.path.join(self.temp_dir.name, "baz.txt")
+        with open(filename, "w+", encoding="utf8") as f:
+            f.write("10.00\t 0.95861\t 0.04855\n")
+        self.metadata.file["name"] = filename
+        self.importer.metadata = self.metadata
+        material_ = self.importer.import_data()
+        self.assertEqual(1, material_.n_data.data.size)
+
     def test_import_data_without_uncertainties_doesnt_set_uncertainties(self):
-        self.create_data_file()
-        with open(self.data_filename, "w", encoding="utf8") as f:
-            f.write(DATA_WITHOUT_UNCERTAINTIES)
+        self.metadata.file["name"] = self.data_filename_without_uncertainties
         self.importer.metadata = self.metadata
         material_ = self.importer.import_data()
         self.assertFalse(material_.n_data.has_uncertainties())
@@ -275,11 +290,11 @@ class TestTxtDataImporter(unittest.TestCase):
 
 class TestCreateMetadataFile(unittest.TestCase):
     def setUp(self):
-        self.filename = "foo.yaml"
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "foo.yaml")
 
     def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        self.temp_dir.cleanup()
 
     def test_crate_metadata_file_creates_file(self):
         io.create_metadata_file(filename=self.filename)
@@ -295,7 +310,7 @@ class TestCreateMetadataFile(unittest.TestCase):
         metadata.references.append("")
         io.create_metadata_file(filename=self.filename)
         with open(self.filename, "r", encoding="utf8") as file:
-            metadata_dict = yaml.safe_load(file)
+            metadata_dict = yaml.load(file, Loader=io._Loader)
         self.assertDictEqual(metadata_dict, metadata.to_dict())
 
 
@@ -307,15 +322,20 @@ class TestMetadata(unittest.TestCase):
         metadata.references.append("")
         self.metadata_dict = metadata.to_dict()
         # self.metadata_dict = copy.deepcopy(io.METADATA_DICT)
-        self.filename = "test.yaml"
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "test.yaml")
 
     def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        self.temp_dir.cleanup()
 
     def create_metadata_file(self):
         with open(self.filename, "w+", encoding="utf8") as file:
-            file.write(yaml.dump(self.metadata_dict))
+            file.write(
+                yaml.dump(
+                    self.metadata_dict,
+                    Dumper=io._Dumper,
+                )
+            )
 
     def test_instantiate_class(self):
         pass
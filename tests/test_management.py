@@ -7,6 +7,14 @@ from ocdb import management
 
 
 class TestCollectionCreator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Creating a collection imports all its data, hence do it only once
+        # for those tests only inspecting the resulting collection.
+        cls.collection = management.CollectionCreator().create(
+            name="elements"
+        )
+
     def setUp(self):
         self.collection_creator = management.CollectionCreator()
 
@@ -41,35 +49,29 @@ class TestCollectionCreator(unittest.TestCase):
             self.collection_creator.create()
 
     def test_create_adds_actual_material(self):
-        self.collection_creator.name = "elements"
-        collection = self.collection_creator.create()
+        collection = self.collection
         self.assertTrue(hasattr(collection, "Co"))
 
     def test_with_versions_adds_version(self):
-        self.collection_creator.name = "elements"
-        collection = self.collection_creator.create()
+        collection = self.collection
         self.assertTrue(collection.Ta.versions)
 
     def test_added_version_is_version(self):
-        self.collection_creator.name = "elements"
-        collection = self.collection_creator.create()
+        collection = self.collection
         self.assertIsInstance(
             collection.Ta.versions[0], ocdb.material.Version
         )
 
     def test_added_version_has_material(self):
-        self.collection_creator.name = "elements"
-        collection = self.collection_creator.create()
+        collection = self.collection
         self.assertTrue(collection.Ta.versions[0].material)
 
     def test_added_version_has_description(self):
-        self.collection_creator.name = "elements"
-        collection = self.collection_creator.create()
+        collection = self.collection
         self.assertTrue(collection.Ta.versions[0].description)
 
     def test_create_adds_processing_step_factory_to_material(self):
-        self.collection_creator.name = "elements"
-        collection = self.collection_creator.create()
+        collection = self.collection
         self.assertIsInstance(
             collection.Co.processing_step_factory,
             ocdb.processing.ProcessingStepFactory,
@@ -79,8 +81,7 @@ class TestCollectionCreator(unittest.TestCase):
         hasattr(ocdb.plotting, "plt"), "Matplotlib not loaded"
     )
     def test_create_adds_plotter_factory_to_material(self):
-        self.collection_creator.name = "elements"
-        collection = self.collection_creator.create()
+        collection = self.collection
         self.assertIsInstance(
             collection.Co.plotter_factory,
             ocdb.plotting.PlotterFactory,
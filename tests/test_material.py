@@ -53,7 +53,16 @@ class TestMaterial(unittest.TestCase):
         self.assertIsInstance(nk, tuple)
         self.assertIsInstance(nk[0], np.ndarray)
         self.assertIsInstance(nk[1], np.ndarray)
-        self.assertTrue(all(np.iscomplex(nk[1])))
+        self.assertTrue(np.iscomplexobj(nk[1]))
+
+    def test_index_of_refraction_returns_n_minus_ik(self):
+        self.material.n_data.data = np.asarray([0.9, 0.8])
+        self.material.k_data.data = np.asarray([0.1, 0.2])
+        nk = self.material.index_of_refraction()
+        np.testing.assert_array_equal(
+            self.material.n_data.data - 1j * self.material.k_data.data,
+            nk[1],
+        )
 
     def test_n_with_uncertainties_returns_four_numpy_arrays(self):
         n = self.material.n(uncertainties=True)
@@ -203,7 +212,7 @@ class TestMaterial(unittest.TestCase):
         kwargs = {"values": 13.5, "interpolation": None}
         self.material.n_data.data = np.zeros(1)
         _, data = self.material.n(**kwargs)
-        self.assertEqual(self.material.n_data.data, np.zeros(1))
+        np.testing.assert_array_equal(self.material.n_data.data, np.zeros(1))
 
     def test_n_calls_processing_step_factory_with_unit(self):
         class ProcessingStepFactory(material.AbstractProcessingStepFactory):
@@ -286,7 +295,7 @@ class TestMaterial(unittest.TestCase):
         kwargs = {"values": 13.5, "interpolation": None}
         self.material.k_data.data = np.zeros(1)
         _, data = self.material.k(**kwargs)
-        self.assertEqual(np.zeros(1), self.material.k_data.data)
+        np.testing.assert_array_equal(np.zeros(1), self.material.k_data.data)
 
     def test_index_of_refraction_calls_processing_step_factory_with_kwargs(
         self,
@@ -359,16 +368,15 @@ class TestMaterial(unittest.TestCase):
         self.material.n_data.data = np.zeros(1)
         self.material.k_data.data = np.ones(1)
         _, data = self.material.index_of_refraction(**kwargs)
-        self.assertEqual(np.zeros(1), self.material.n_data.data)
-        self.assertEqual(np.ones(1), self.material.k_data.data)
+        np.testing.assert_array_equal(np.zeros(1), self.material.n_data.data)
+        np.testing.assert_array_equal(np.ones(1), self.material.k_data.data)
 
     def test_has_uncertainties_returns_actual_true_if_lb_and_ub_present(self):
         self.material.n_data.lower_bounds = np.zeros(10)
         self.material.n_data.upper_bounds = np.ones(10)
         self.material.k_data.lower_bounds = np.zeros(10)
         self.material.k_data.upper_bounds = np.ones(10)
-        self.assertTrue(self.material.has_uncertainties())
-        self.assertEqual(True, self.material.has_uncertainties())
+        self.assertIs(True, self.material.has_uncertainties())
 
     def test_has_uncertainties_returns_false_if_no_n_uncertainties(self):
         self.material.k_data.lower_bounds = np.zeros(10)
@@ -403,8 +411,7 @@ class TestData(unittest.TestCase):
     def test_has_uncertainties_returns_actual_true_if_lb_and_ub_present(self):
         self.data.lower_bounds = np.zeros(10)
         self.data.upper_bounds = np.ones(10)
-        self.assertTrue(self.data.has_uncertainties())
-        self.assertEqual(True, self.data.has_uncertainties())
+        self.assertIs(True, self.data.has_uncertainties())
 
     def test_has_uncertainties_returns_false_if_lb_is_missing(self):
         self.data.upper_bounds = np.ones(10)
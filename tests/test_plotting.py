@@ -1,5 +1,6 @@
 import matplotlib.figure
 import matplotlib.axes
+import matplotlib.colors
 import matplotlib.pyplot as plt
 import unittest
 
@@ -7,6 +8,9 @@ import numpy as np
 
 from ocdb import material, plotting
 
+# Use non-interactive backend, as no figures get shown during the tests
+plt.switch_backend("Agg")
+
 
 class TestPlotterFactory(unittest.TestCase):
     def setUp(self):
@@ -102,12 +106,13 @@ class TestPlotterFactory(unittest.TestCase):
     def test_without_values_with_na_uncertainties_returns_single_plotter(
         self,
     ):
+        plotter = self.factory.get_plotter(uncertainties=True)
         self.assertIsInstance(
-            self.factory.get_plotter(uncertainties=True),
+            plotter,
             plotting.SinglePlotter,
         )
         self.assertNotIsInstance(
-            self.factory.get_plotter(uncertainties=True),
+            plotter,
             plotting.SingleUncertaintiesPlotter,
         )
 
@@ -136,12 +141,13 @@ class TestPlotterFactory(unittest.TestCase):
         self.assertEqual(plotter.parameters["values"], "k")
 
     def test_plot_both_with_na_uncertainties_returns_twin_plotter(self):
+        plotter = self.factory.get_plotter(values="both", uncertainties=True)
         self.assertIsInstance(
-            self.factory.get_plotter(values="both", uncertainties=True),
+            plotter,
             plotting.TwinPlotter,
         )
         self.assertNotIsInstance(
-            self.factory.get_plotter(values="both", uncertainties=True),
+            plotter,
             plotting.TwinUncertaintiesPlotter,
         )
 
@@ -387,14 +393,14 @@ class TestSingleUncertaintiesPlotter(unittest.TestCase):
     def setUp(self):
         self.plotter = plotting.SingleUncertaintiesPlotter()
         self.material = material.Material()
+        # Fixed seed for reproducible noise on the bounds
+        rng = np.random.default_rng(0)
         self.material.n_data.data = np.linspace(0.98, 0.99, 10)
         self.material.n_data.lower_bounds = (
-            self.material.n_data.data
-            - np.random.normal(0.005, 0.002, size=10)
+            self.material.n_data.data - rng.normal(0.005, 0.002, size=10)
         )
         self.material.n_data.upper_bounds = (
-            self.material.n_data.data
-            + np.random.normal(0.005, 0.002, size=10)
+            self.material.n_data.data + rng.normal(0.005, 0.002, size=10)
         )
         self.material.n_data.axes[0].values = np.linspace(10, 12, 10)
         self.material.n_data.axes[0].symbol = r"\lambda"
@@ -402,11 +408,10 @@ class TestSingleUncertaintiesPlotter(unittest.TestCase):
         self.material.n_data.axes[0].unit = "nm"
         self.material.k_data.data = np.linspace(0.02, 0.01, 10)
         self.material.k_data.lower_bounds = (
-            self.material.k_data.data - np.random.normal(0.01, 0.002, size=10)
+            self.material.k_data.data - rng.normal(0.01, 0.002, size=10)
         )
         self.material.k_data.upper_bounds = (
-            self.material.k_data.data
-            + np.random.normal(0.005, 0.002, size=10)
+            self.material.k_data.data + rng.normal(0.005, 0.002, size=10)
         )
         self.material.k_data.axes[0].values = np.linspace(10, 12, 10)
         self.material.k_data.axes[0].symbol = r"\lambda"
@@ -432,16 +437,17 @@ class TestSingleUncertaintiesPlotter(unittest.TestCase):
         self.plotter.dataset = self.material
         self.plotter.parameters["values"] = "n"
         self.plotter.plot()
-        np.testing.assert_array_equal(
+        polygon = (
             self.plotter.axes.get_children()[1]
             .get_paths()[0]
-            .to_polygons()[0][1:11, 1],
+            .to_polygons()[0]
+        )
+        np.testing.assert_array_equal(
+            polygon[1:11, 1],
             self.material.n_data.lower_bounds,
         )
         np.testing.assert_array_equal(
-            self.plotter.axes.get_children()[1]
-            .get_paths()[0]
-            .to_polygons()[0][12:, 1],
+            polygon[12:, 1],
             self.material.n_data.upper_bounds[::-1],
         )
 
@@ -458,16 +464,17 @@ class TestSingleUncertaintiesPlotter(unittest.TestCase):
         self.plotter.dataset = self.material
         self.plotter.parameters["values"] = "k"
         self.plotter.plot()
-        np.testing.assert_array_equal(
+        polygon = (
             self.plotter.axes.get_children()[1]
             .get_paths()[0]
-            .to_polygons()[0][1:11, 1],
+            .to_polygons()[0]
+        )
+        np.testing.assert_array_equal(
+            polygon[1:11, 1],
             self.material.k_data.lower_bounds,
         )
         np.testing.assert_array_equal(
-            self.plotter.axes.get_children()[1]
-            .get_paths()[0]
-            .to_polygons()[0][12:, 1],
+            polygon[12:, 1],
             self.material.k_data.upper_bounds[::-1],
         )
 
@@ -486,14 +493,14 @@ class TestTwinUncertaintiesPlotter(unittest.TestCase):
     def setUp(self):
         self.plotter = plotting.TwinUncertaintiesPlotter()
         self.material = material.Material()
+        # Fixed seed for reproducible noise on the bounds
+        rng = np.random.default_rng(0)
         self.material.n_data.data = np.linspace(0.98, 0.99, 10)
         self.material.n_data.lower_bounds = (
-            self.material.n_data.data
-            - np.random.normal(0.005, 0.002, size=10)
+            self.material.n_data.data - rng.normal(0.005, 0.002, size=10)
         )
         self.material.n_data.upper_bounds = (
-            self.material.n_data.data
-            + np.random.normal(0.005, 0.002, size=10)
+            self.material.n_data.data + rng.normal(0.005, 0.002, size=10)
         )
         self.material.n_data.axes[0].values = np.linspace(10, 12, 10)
         self.material.n_data.axes[0].symbol = r"\lambda"
@@ -501,11 +508,10 @@ class TestTwinUncertaintiesPlotter(unittest.TestCase):
         self.material.n_data.axes[0].unit = "nm"
         self.material.k_data.data = np.linspace(0.02, 0.01, 10)
         self.material.k_data.lower_bounds = (
-            self.material.k_data.data - np.random.normal(0.01, 0.002, size=10)
+            self.material.k_data.data - rng.normal(0.01, 0.002, size=10)
         )
         self.material.k_data.upper_bounds = (
-            self.material.k_data.data
-            + np.random.normal(0.005, 0.002, size=10)
+            self.material.k_data.data + rng.normal(0.005, 0.002, size=10)
         )
         self.material.k_data.axes[0].values = np.linspace(10, 12, 10)
         self.material.k_data.axes[0].symbol = r"\lambda"
@@ -554,32 +560,34 @@ class TestTwinUncertaintiesPlotter(unittest.TestCase):
     def test_plot_plots_n_uncertainties(self):
         self.plotter.dataset = self.material
         self.plotter.plot()
-        np.testing.assert_array_equal(
+        polygon = (
             self.plotter.axes.get_children()[1]
             .get_paths()[0]
-            .to_polygons()[0][1:11, 1],
+            .to_polygons()[0]
+        )
+        np.testing.assert_array_equal(
+            polygon[1:11, 1],
             self.material.n_data.lower_bounds,
         )
         np.testing.assert_array_equal(
-            self.plotter.axes.get_children()[1]
-            .get_paths()[0]
-            .to_polygons()[0][12:, 1],
+            polygon[12:, 1],
             self.material.n_data.upper_bounds[::-1],
         )
 
     def test_plot_plots_k_uncertainties(self):
         self.plotter.dataset = self.material
         self.plotter.plot()
-        np.testing.assert_array_equal(
+        polygon = (
             self.plotter.axes2.get_children()[1]
             .get_paths()[0]
-            .to_polygons()[0][1:11, 1],
+            .to_polygons()[0]
+        )
+        np.testing.assert_array_equal(
+            polygon[1:11, 1],
             self.material.k_data.lower_bounds,
         )
         np.testing.assert_array_equal(
-            self.plotter.axes2.get_children()[1]
-            .get_paths()[0]
-            .to_polygons()[0][12:, 1],
+            polygon[12:, 1],
             self.material.k_data.upper_bounds[::-1],
         )
 
@@ -1,3 +1,4 @@
+import copy
 import numpy as np
 import unittest
 
@@ -106,6 +107,17 @@ class TestInterpolation(unittest.TestCase):
     def test_instantiate_class(self):
         pass
 
+    def test_interpolate_without_values_raises(self):
+        self.interpolation.data = self.data
+        with self.assertRaisesRegex(ValueError, "No values provided"):
+            self.interpolation.process()
+
+    def test_interpolate_nan_value_raises(self):
+        self.interpolation.data = self.data
+        self.interpolation.parameters["values"] = [13, np.nan]
+        with self.assertRaisesRegex(ValueError, "must not be NaN"):
+            self.interpolation.process()
+
     def test_interpolate_single_value_returns_data_with_one_value(self):
         self.interpolation.data = self.data
         self.interpolation.parameters["values"] = 13.5
@@ -124,6 +136,20 @@ class TestInterpolation(unittest.TestCase):
         self.assertEqual(self.interpolation.data.lower_bounds.size, 1)
         self.assertEqual(self.interpolation.data.upper_bounds.size, 1)
 
+    def test_interpolate_list_returns_data_with_correct_size(self):
+        self.interpolation.data = self.data
+        self.interpolation.parameters["values"] = [13, 13.5, 14]
+        self.interpolation.process()
+        self.assertEqual(self.interpolation.data.data.size, 3)
+        self.assertEqual(self.interpolation.data.axes[0].values.size, 3)
+
+    def test_interpolate_2d_values_returns_1d_data(self):
+        self.interpolation.data = self.data
+        self.interpolation.parameters["values"] = [[13.5, 14.5]]
+        self.interpolation.process()
+        self.assertEqual((2,), self.interpolation.data.data.shape)
+        self.assertEqual((2,), self.interpolation.data.axes[0].values.shape)
+
     def test_interpolate_single_value_returns_correct_value_in_data(self):
         self.interpolation.data = self.data
         value = np.interp(13.5, self.data.axes[0].values, self.data.data)
@@ -131,6 +157,53 @@ class TestInterpolation(unittest.TestCase):
         self.interpolation.process()
         self.assertAlmostEqual(self.interpolation.data.data, value, 1e-5)
 
+    def test_interpolate_with_descending_axis_returns_correct_value(self):
+        self.data.data = self.data.data[::-1]
+        self.data.axes[0].values = self.data.axes[0].values[::-1]
+        self.interpolation.data = self.data
+        self.interpolation.parameters["values"] = 13.5
+        self.interpolation.process()
+        self.assertAlmostEqual(2.35, self.interpolation.data.data[0])
+
+    def test_interpolate_float32_data_keeps_dtype(self):
+        self.data.data = self.data.data.astype(np.float32)
+        self.interpolation.data = self.data
+        self.interpolation.parameters["values"] = 13.5
+        self.interpolation.process()
+        self.assertEqual(np.float32, self.interpolation.data.data.dtype)
+
+    def test_interpolate_integer_data_returns_correct_value(self):
+        self.data.data = np.arange(10) * 2
+        self.data.axes[0].values = np.arange(10, 20)
+        self.data.lower_bounds = np.ndarray(0)
+        self.data.upper_bounds = np.ndarray(0)
+        self.interpolation.data = self.data
+        self.interpolation.parameters["values"] = 13.5
+        self.interpolation.process()
+        np.testing.assert_array_equal([7.0], self.interpolation.data.data)
+
+    def test_interpolate_last_value_in_axis_returns_value_in_data(self):
+        self.interpolation.data = copy.deepcopy(self.data)
+        self.interpolation.parameters["values"] = 20
+        self.interpolation.process()
+        self.assertEqual(self.data.data[-1], self.interpolation.data.data[0])
+
+    def test_interpolate_last_value_in_axis_does_not_interpolate(self):
+        self.interpolation.data = copy.deepcopy(self.data)
+        self.interpolation.parameters["values"] = 20
+        self.interpolation._sanitise_parameters()
+        _, _, weight = self.interpolation._interpolation_weights()
+        self.assertFalse(weight.any())
+
+    def test_interpolate_value_in_axis_returns_value_in_data(self):
+        self.interpolation.data = copy.deepcopy(self.data)
+        self.interpolation.parameters["values"] = 13
+        self.interpolation.process()
+        self.assertEqual(self.interpolation.data.data, self.data.data[3])
+        self.assertEqual(
+            self.interpolation.data.lower_bounds, self.data.lower_bounds[3]
+        )
+
     def test_interpolate_single_value_returns_correct_value_in_axes(self):
         self.interpolation.data = self.data
         self.interpolation.parameters["values"] = 13.5
@@ -245,13 +318,30 @@ class TestInterpolation(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, r"Value\(s\) not available"):
             self.interpolation.process()
 
-    def test_interpolate_range_na_value_with_kind_none_raises(self):
+    def test_interpolate_range_partly_na_value_with_kind_none_raises(self):
         self.interpolation.data = self.data
         self.interpolation.parameters["values"] = np.linspace(10, 20, 21)
         self.interpolation.parameters["kind"] = None
         with self.assertRaisesRegex(ValueError, r"Value\(s\) not available"):
             self.interpolation.process()
 
+    def test_interpolate_range_with_kind_none_returns_data(self):
+        self.interpolation.data = self.data
+        self.interpolation.parameters["values"] = np.asarray([10.0, 13.0])
+        self.interpolation.parameters["kind"] = None
+        expected = self.data.data[[0, 3]]
+        data = self.interpolation.process()
+        np.testing.assert_array_equal(expected, data.data)
+
+    def test_interpolate_with_kind_none_and_descending_axis(self):
+        self.data.axes[0].values = self.data.axes[0].values[::-1]
+        self.interpolation.data = self.data
+        self.interpolation.parameters["values"] = np.asarray([10.0, 13.0])
+        self.interpolation.parameters["kind"] = None
+        expected = self.data.data[[10, 7]]
+        data = self.interpolation.process()
+        np.testing.assert_array_equal(expected, data.data)
+
 
 class TestUnitConversion(unittest.TestCase):
     def setUp(self):
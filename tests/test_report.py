@@ -2,10 +2,13 @@ import contextlib
 import datetime
 import io
 import os
+import shutil
+import sys
+import tempfile
 import unittest
+from unittest import mock
 
 import jinja2
-import numpy as np
 
 import ocdb.material
 import ocdb.management
@@ -14,6 +17,9 @@ from ocdb import report
 
 class TestReporter(unittest.TestCase):
     def setUp(self):
+        # Tests rewrite templates, possibly within the resolution of the
+        # file modification time, hence do not reuse cached templates.
+        report.Reporter._environments.clear()
         self.reporter = report.Reporter()
         self.template = "test_template.j2"
         self.template2 = os.path.abspath(self.template)
@@ -30,6 +36,21 @@ class TestReporter(unittest.TestCase):
     def test_instantiate_class(self):
         pass
 
+    def test_reporters_share_environment(self):
+        reporter = report.Reporter()
+        self.assertIs(self.reporter._environment, reporter._environment)
+
+    def test_environment_uses_environment_options(self):
+        bytecode_cache = jinja2.FileSystemBytecodeCache()
+        report.Reporter._environments.clear()
+        with mock.patch.object(
+            report.Reporter,
+            "environment_options",
+            {"bytecode_cache": bytecode_cache},
+        ):
+            reporter = report.Reporter()
+        self.assertIs(bytecode_cache, reporter._environment.bytecode_cache)
+
     def test_render_without_template_raises(self):
         self.reporter.template = ""
         with self.assertRaisesRegex(ValueError, "No template provided"):
@@ -80,6 +101,24 @@ class TestReporter(unittest.TestCase):
             report_content = file.read()
         self.assertEqual("bla foobar", report_content)
 
+    def test_save_with_unchanged_report_does_not_write_file(self):
+        with open(self.filename, "w+") as f:
+            f.write("foobar")
+        os.utime(self.filename, (0, 0))
+        self.reporter.filename = self.filename
+        self.reporter.report = "foobar"
+        self.reporter.save()
+        self.assertEqual(0, os.path.getmtime(self.filename))
+
+    def test_save_with_changed_report_writes_file(self):
+        with open(self.filename, "w+") as f:
+            f.write("foo")
+        self.reporter.filename = self.filename
+        self.reporter.report = "foobar"
+        self.reporter.save()
+        with open(self.filename) as f:
+            self.assertEqual("foobar", f.read())
+
     def test_render_sets_template_dir_in_context(self):
         with open(self.template2, "w+") as f:
             f.write("")
@@ -100,6 +139,55 @@ class TestReporter(unittest.TestCase):
             self.reporter.context["timestamp"],
         )
 
+    def test_render_does_not_set_timestamp(self):
+        with open(self.template, "w+") as f:
+            f.write("")
+        self.reporter.template = self.template
+        self.reporter.render()
+        self.assertEqual("", self.reporter.timestamp)
+
+    def test_render_with_timestamp_sets_timestamp_in_context(self):
+        with open(self.template, "w+") as f:
+            f.write("")
+        self.reporter.template = self.template
+        self.reporter.timestamp = "2022-01-01 12:00:00"
+        self.reporter.render()
+        self.assertEqual(
+            self.reporter.timestamp, self.reporter.context["timestamp"]
+        )
+
+
+class TestFileSystemLoader(unittest.TestCase):
+    def setUp(self):
+        self.loader = report.FileSystemLoader([os.path.abspath(".")])
+        self.environment = jinja2.Environment(loader=self.loader)
+        self.template = "test_template.j2"
+
+    def tearDown(self):
+        if os.path.exists(self.template):
+            os.remove(self.template)
+
+    def test_instantiate_class(self):
+        pass
+
+    def test_load_template_with_relative_path(self):
+        with open(self.template, "w+") as f:
+            f.write("foo")
+        template = self.environment.get_template(self.template)
+        self.assertEqual("foo", template.render())
+
+    def test_load_template_with_absolute_path(self):
+        with open(self.template, "w+") as f:
+            f.write("foo")
+        template = self.environment.get_template(
+            os.path.abspath(self.template)
+        )
+        self.assertEqual("foo", template.render())
+
+    def test_load_template_not_in_search_path_raises(self):
+        with self.assertRaises(jinja2.exceptions.TemplateNotFound):
+            self.environment.get_template("tmp/foo.j2")
+
 
 class TestGenericEnvironment(unittest.TestCase):
     def setUp(self):
@@ -127,6 +215,56 @@ class TestGenericEnvironment(unittest.TestCase):
             path, self.environment.loader.loaders[-1].package_path
         )
 
+    def test_has_default_search_path(self):
+        search_path = [os.path.abspath(".")]
+        # noinspection PyUnresolvedReferences
+        self.assertEqual(
+            search_path, self.environment.loader.loaders[0].searchpath
+        )
+
+    def test_with_search_path_sets_search_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            environment = report.GenericEnvironment(search_path=[directory])
+        # noinspection PyUnresolvedReferences
+        self.assertEqual(
+            [directory], environment.loader.loaders[0].searchpath
+        )
+
+    def test_with_search_path_loads_template_from_search_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(
+                os.path.join(directory, "test_template.j2"),
+                "w+",
+                encoding="utf8",
+            ) as file:
+                file.write("Lorem ipsum")
+            environment = report.GenericEnvironment(search_path=[directory])
+            template = environment.get_template("test_template.j2")
+        self.assertEqual("Lorem ipsum", template.render())
+
+    def test_has_no_bytecode_cache(self):
+        self.assertIsNone(self.environment.bytecode_cache)
+
+    def test_with_bytecode_cache_in_env_sets_bytecode_cache(self):
+        bytecode_cache = jinja2.FileSystemBytecodeCache()
+        environment = report.GenericEnvironment(
+            env={"bytecode_cache": bytecode_cache}
+        )
+        self.assertIs(bytecode_cache, environment.bytecode_cache)
+
+    def test_environments_share_package_loader(self):
+        environment = report.GenericEnvironment()
+        # noinspection PyUnresolvedReferences
+        self.assertIs(
+            self.environment.loader.loaders[-1],
+            environment.loader.loaders[-1],
+        )
+
+    def test_does_not_modify_env(self):
+        env = {"trim_blocks": True}
+        report.GenericEnvironment(env=env)
+        self.assertEqual({"trim_blocks": True}, env)
+
 
 class TestLaTeXEnvironment(unittest.TestCase):
     def setUp(self):
@@ -154,9 +292,20 @@ class TestLaTeXEnvironment(unittest.TestCase):
             path, self.environment.loader.loaders[-1].package_path
         )
 
+    def test_with_bytecode_cache_in_env_sets_bytecode_cache(self):
+        bytecode_cache = jinja2.FileSystemBytecodeCache()
+        environment = report.LaTeXEnvironment(
+            env={"bytecode_cache": bytecode_cache}
+        )
+        self.assertIs(bytecode_cache, environment.bytecode_cache)
+        self.assertEqual("{@", environment.variable_start_string)
+
 
 class TestLaTeXReporter(unittest.TestCase):
     def setUp(self):
+        # Tests rewrite templates, possibly within the resolution of the
+        # file modification time, hence do not reuse cached templates.
+        report.Reporter._environments.clear()
         self.reporter = report.LaTeXReporter()
         self.template = "test_template.tex"
         self.filename = "test_report.tex"
@@ -179,11 +328,34 @@ class TestLaTeXReporter(unittest.TestCase):
     def test_instantiate_class(self):
         pass
 
+    def test_instantiate_class_does_not_create_temp_dir(self):
+        with mock.patch("tempfile.mkdtemp") as mkdtemp:
+            report.LaTeXReporter()
+        mkdtemp.assert_not_called()
+
     def test_environment_is_latex_environment(self):
         self.assertTrue(
             isinstance(self.reporter._environment, report.LaTeXEnvironment)
         )
 
+    def test_environment_uses_environment_options(self):
+        report.Reporter._environments.clear()
+        with mock.patch.object(
+            report.LaTeXReporter, "environment_options", {"cache_size": 10}
+        ):
+            reporter = report.LaTeXReporter()
+        self.assertEqual(10, reporter._environment.cache.capacity)
+
+    def test_environment_options_can_disable_auto_reload(self):
+        report.Reporter._environments.clear()
+        with mock.patch.object(
+            report.LaTeXReporter,
+            "environment_options",
+            {"auto_reload": False},
+        ):
+            reporter = report.LaTeXReporter()
+        self.assertFalse(reporter._environment.auto_reload)
+
     def test_compile_with_not_existing_latex_executable_raises(self):
         self.reporter.latex_executable = "foo"
         message = r"LaTeX executable \w* not found"
@@ -196,6 +368,13 @@ class TestLaTeXReporter(unittest.TestCase):
         with self.assertRaisesRegex(FileNotFoundError, message):
             self.reporter.compile()
 
+    def test_compile_with_not_existing_latexmk_executable_raises(self):
+        self.reporter.latex_executable = sys.executable
+        self.reporter.latexmk_executable = "foo"
+        message = r"latexmk executable \w* not found"
+        with self.assertRaisesRegex(FileNotFoundError, message):
+            self.reporter.compile()
+
     def test_compile_creates_output(self):
         template_content = (
             "\\documentclass{article}"
@@ -254,6 +433,72 @@ class TestLaTeXReporter(unittest.TestCase):
         logfile = ".".join([basename, "log"])
         self.assertFalse(os.path.exists(logfile))
 
+    def test_rerun_not_necessary_without_hint_in_log(self):
+        self.reporter.filename = self.filename
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        with open(os.path.join(temp_dir, "test_report.log"), "w+") as f:
+            f.write("Output written on test_report.pdf (1 page).")
+        self.assertFalse(self.reporter._rerun_necessary(temp_dir))
+
+    def test_rerun_not_necessary_without_log(self):
+        self.reporter.filename = self.filename
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        self.assertFalse(self.reporter._rerun_necessary(temp_dir))
+
+    def test_rerun_necessary_with_hint_in_log(self):
+        self.reporter.filename = self.filename
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        with open(os.path.join(temp_dir, "test_report.log"), "w+") as f:
+            f.write(
+                "LaTeX Warning: Label(s) may have changed. "
+                "Rerun to get cross-references right."
+            )
+        self.assertTrue(self.reporter._rerun_necessary(temp_dir))
+
+    def test_which_returns_path_of_executable(self):
+        self.assertEqual(
+            shutil.which(sys.executable),
+            self.reporter._which(sys.executable),
+        )
+
+    def test_which_with_not_existing_executable_returns_none(self):
+        self.assertIsNone(self.reporter._which("foo"))
+
+    def test_stage_provides_file_at_destination(self):
+        with open(self.include, "w+") as f:
+            f.write("foobar")
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        destination = os.path.join(temp_dir, self.include)
+        self.reporter._stage(self.include, destination)
+        with open(destination) as f:
+            self.assertEqual("foobar", f.read())
+
+    def test_stage_overwrites_existing_destination(self):
+        with open(self.include, "w+") as f:
+            f.write("foobar")
+        with open(self.template, "w+") as f:
+            f.write("")
+        self.reporter._stage(self.include, self.template)
+        with open(self.template) as f:
+            self.assertEqual("foobar", f.read())
+
+    def test_run_discards_output_by_default(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.reporter._run([sys.executable, "-c", "print('foobar')"])
+        self.assertNotIn("foobar", output.getvalue())
+
+    def test_run_with_verbose_prints_output(self):
+        self.reporter.verbose = True
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.reporter._run([sys.executable, "-c", "print('foobar')"])
+        self.assertIn("foobar", output.getvalue())
+
     def test_render_with_template_from_package(self):
         self.reporter.template = "base.tex"
         self.reporter.context = {}
@@ -295,37 +540,77 @@ class TestLaTeXReporter(unittest.TestCase):
         self.assertTrue(os.path.exists(self.result))
 
 
+class DummyMaterialReporter(report.MaterialReporter):
+    """Reporter writing a file per material instead of running LaTeX."""
+
+    def create(self):
+        with open(f"{self.material.symbol}-report.txt", "w+") as file:
+            file.write(self.material.symbol)
+
+
+class TestMaterialReporterCreateMany(unittest.TestCase):
+    def setUp(self):
+        self.materials = [ocdb.material.Material() for _ in range(2)]
+        self.materials[0].symbol = "Foo"
+        self.materials[1].symbol = "Bar"
+        self.filenames = [
+            f"{material.symbol}-report.txt" for material in self.materials
+        ]
+
+    def tearDown(self):
+        for filename in self.filenames:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_create_many_creates_report_for_each_material(self):
+        DummyMaterialReporter.create_many(self.materials, max_workers=2)
+        for filename in self.filenames:
+            self.assertTrue(os.path.exists(filename))
+
+    def test_create_many_without_materials_does_nothing(self):
+        DummyMaterialReporter.create_many([])
+        for filename in self.filenames:
+            self.assertFalse(os.path.exists(filename))
+
+
 @unittest.skip("LaTeX runs take too long...")
 class TestMaterialReporter(unittest.TestCase):
-    def setUp(self):
-        self.reporter = report.MaterialReporter()
+    @classmethod
+    def setUpClass(cls):
         collection = ocdb.management.CollectionCreator().create(
             name="elements"
         )
-        self.material = collection.Ta
-        self.figure_filename = f"{self.material.symbol}.pdf"
-        self.bibliography_filename = f"{self.material.symbol}.bib"
-        self.report_filename = f"{self.material.symbol}-report.tex"
-        self.report_pdf = f"{self.material.symbol}-report.pdf"
+        cls.material = collection.Ta
+        cls.figure_filename = f"{cls.material.symbol}.pdf"
+        cls.bibliography_filename = f"{cls.material.symbol}.bib"
+        cls.report_filename = f"{cls.material.symbol}-report.tex"
+        cls.report_pdf = f"{cls.material.symbol}-report.pdf"
+        # Creating a report includes running LaTeX, hence do it only once
+        # for those tests only inspecting the results.
+        cls.created_reporter = report.MaterialReporter()
+        cls.created_reporter.material = cls.material
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.created_reporter.create()
+
+    @classmethod
+    def tearDownClass(cls):
+        for filename in [
+            cls.figure_filename,
+            cls.bibliography_filename,
+            cls.report_filename,
+            cls.report_pdf,
+        ]:
+            if os.path.exists(filename):
+                os.remove(filename)
 
-    def tearDown(self):
-        if os.path.exists(self.figure_filename):
-            os.remove(self.figure_filename)
-        if os.path.exists(self.bibliography_filename):
-            os.remove(self.bibliography_filename)
-        if os.path.exists(self.report_filename):
-            os.remove(self.report_filename)
-        if os.path.exists(self.report_pdf):
-            os.remove(self.report_pdf)
+    def setUp(self):
+        self.reporter = report.MaterialReporter()
 
     def test_instantiate_class(self):
         pass
 
     def test_create_sets_reporter(self):
-        self.reporter.material = self.material
-        with contextlib.redirect_stdout(io.StringIO()):
-            self.reporter.create()
-        self.assertTrue(self.reporter.reporter)
+        self.assertTrue(self.created_reporter.reporter)
 
     def test_create_with_unknown_output_format_raises(self):
         self.reporter.material = self.material
@@ -338,33 +623,18 @@ class TestMaterialReporter(unittest.TestCase):
             self.reporter.create()
 
     def test_create_creates_plot(self):
-        self.reporter.material = self.material
-        with contextlib.redirect_stdout(io.StringIO()):
-            self.reporter.create()
         self.assertTrue(os.path.exists(self.figure_filename))
 
     def test_create_creates_bibliography(self):
-        self.reporter.material = self.material
-        with contextlib.redirect_stdout(io.StringIO()):
-            self.reporter.create()
         self.assertTrue(os.path.exists(self.bibliography_filename))
 
     def test_create_fills_bibliography(self):
-        self.reporter.material = self.material
-        with contextlib.redirect_stdout(io.StringIO()):
-            self.reporter.create()
         with open(self.bibliography_filename) as file:
             bibliography = file.read()
         self.assertIn(self.material.references[0].key, bibliography)
 
     def test_create_creates_report(self):
-        self.reporter.material = self.material
-        with contextlib.redirect_stdout(io.StringIO()):
-            self.reporter.create()
         self.assertTrue(os.path.exists(self.report_filename))
 
     def test_create_compiles_report(self):
-        self.reporter.material = self.material
-        with contextlib.redirect_stdout(io.StringIO()):
-            self.reporter.create()
         self.assertTrue(os.path.exists(self.report_pdf))